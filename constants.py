@@ -32,32 +32,38 @@ URL_PARAM_LOCATION = "location"
 URL_PARAM_GEO_ID = "geo_id"
 URL_PARAM_WORK_LOCATION = "work_location"
 
-URL_FOR_N_JOBS = (
-    f"https://www.linkedin.com/jobs/search?"
-    f"keywords={{{URL_PARAM_KEYWORDS}}}&"
-    f"f_TPR=r{{{URL_PARAM_N_SECONDS}}}&"
-    f"location={{{URL_PARAM_LOCATION}}}&"
-    f"geoId={{{URL_PARAM_GEO_ID}}}&"
-    f"f_WT={{{URL_PARAM_WORK_LOCATION}}}"
+# Literal fragments of the search URLs. The values of the URL parameters are
+# spliced in between the fragments (in the order of the fragments), which
+# avoids parsing a format string for every URL that is built.
+URL_FOR_N_JOBS_FRAGMENTS = (
+    "https://www.linkedin.com/jobs/search?keywords=",
+    "&f_TPR=r",
+    "&location=",
+    "&geoId=",
+    "&f_WT=",
 )
-URL_JOB_PAGE = (
+URL_JOB_PAGE_FRAGMENTS = (
     "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search?"
-    f"keywords={{{URL_PARAM_KEYWORDS}}}&"
-    f"f_TPR=r{{{URL_PARAM_N_SECONDS}}}&"
-    f"location={{{URL_PARAM_LOCATION}}}&"
-    f"geoId={{{URL_PARAM_GEO_ID}}}&"
-    f"f_WT={{{URL_PARAM_WORK_LOCATION}}}&"
-    "start={start}"
+    "keywords=",
+    "&f_TPR=r",
+    "&location=",
+    "&geoId=",
+    "&f_WT=",
+    "&start=",
 )
-URL_SINGLE_JOB = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
+URL_SINGLE_JOB_PREFIX = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/"
 
 
 # HTML stuff
-HTML_JOB_TITLE = """
-<h1 class="title">    
-    <a class="hidden-nested-link" href="{link}">{title} at {company}, {location}</a>
-</h1>\n
-"""
+# Literal fragments of a job title; the link, title, company, and location
+# are spliced in between the fragments
+HTML_JOB_TITLE_FRAGMENTS = (
+    '\n<h1 class="title">    \n    <a class="hidden-nested-link" href="',
+    '">',
+    " at ",
+    ", ",
+    "</a>\n</h1>\n\n",
+)
 HTML_JOB_SEPARATOR = "<hr>"
 HTML_KEYWORD_MARK = "<mark>{keyword}</mark>"
 HTML_START = "<html>"
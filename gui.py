@@ -6,15 +6,18 @@ Created on Mon Mar 11 14:16:09 2024
 """
 
 import os
+import re
 import sys
 from enum import Enum
 from typing import Any, Dict, Iterable, List, Optional, Union, Tuple, Callable
 
+import numpy as np
 import pandas as pd
 from pandas import DataFrame
+from pandas.api.types import is_bool_dtype
 from PyQt5.QtCore import (
     QAbstractTableModel, QModelIndex, QObject, Qt, QThread, pyqtSignal)
-from PyQt5.QtGui import QIcon, QKeyEvent
+from PyQt5.QtGui import QFontMetrics, QIcon, QKeyEvent
 from PyQt5.QtWidgets import (
     QAbstractItemView, QApplication, QCheckBox, QFormLayout, QGroupBox,
     QHBoxLayout, QHeaderView, QLabel, QLineEdit, QMessageBox, QPlainTextEdit,
@@ -23,7 +26,7 @@ from PyQt5.QtWidgets import (
 import constants as C
 from job_scraper import (
     DESCRIPTION_KEYWORDS, TITLE_KEYWORDS_TO_ALWAYS_KEEP,
-    TITLE_KEYWORDS_TO_DISCARD, TITLE_KEYWORDS_TO_KEEP, WL, BadStatusCode,
+    TITLE_KEYWORDS_TO_DISCARD, TITLE_KEYWORDS_TO_KEEP, WL,
     LinkedinJobScraper, LinkedinSession, filter_job_descriptions,
     filter_job_titles, save_job_dataframe_to_html_file)
 from logger import CONN, DEBUG, INFO, logger
@@ -33,11 +36,11 @@ logger.setLevel(CONN)
 SIZE_FIXED = QSizePolicy.Fixed
 SIZE_MIN_EXPANDING = QSizePolicy.MinimumExpanding
 
-LABEL_ROLE = QFormLayout.LabelRole
-FIELD_ROLE = QFormLayout.FieldRole
-
 PATH_ICONS = f"{os.path.dirname(__file__)}\\icons"
 
+# Separator of filter keywords: a comma (or several) with surrounding spaces
+KEYWORD_SEPARATOR = re.compile(r"\s*(?:,\s*)+")
+
 
 class MainWindow(QWidget):
     MIN_WIDTH = 1280
@@ -53,6 +56,11 @@ class MainWindow(QWidget):
         )
         AFTER_JOB_DESCR = AFTER_SCRAPE + ("filter_job_descriptions",)
         WHILE_ACTION = ("stop_worker",)
+        # Saving can not be stopped, as that would leave a truncated file
+        WHILE_SAVING = ()
+
+    # Button names per button group, for fast membership tests
+    _BUTTON_GROUP_SETS = {bg: frozenset(bg.value) for bg in BUTTON_GROUPS}
 
     def __init__(
         self,
@@ -85,6 +93,8 @@ class MainWindow(QWidget):
 
         self._last_button_states: Enum = self.BUTTON_GROUPS.AFTER_INIT
         self._results_saved: bool = None
+        # Confirmation dialog for stopping an action, created on first use
+        self._stop_worker_messagebox: Optional[QMessageBox] = None
 
         self._init_ui()
 
@@ -184,15 +194,23 @@ class MainWindow(QWidget):
 
     def _callback_test_session(self) -> None:
         """Callback for the 'Test session' (test_session) button."""
-        self._lock_buttons()
-        try:
-            self.session.test_session()
-            QMessageBox.information(self, "Test session", "Testing successful.")
-        except (SystemError, TimeoutError, BadStatusCode) as e:
-            QMessageBox.critical(
-                self, "Test session", f"Error during testing of session: {e}"
-            )
-        self._unlock_buttons(self._last_button_states)
+        self._set_button_group(self.BUTTON_GROUPS.WHILE_ACTION)
+        self.worker = Worker(self.session.test_session)
+        self.worker.result.connect(self._slot_test_session_result)
+        self.worker.error.connect(self._slot_test_session_error)
+        self.worker.start()
+
+    def _slot_test_session_result(self, _) -> None:
+        """Slot for the test session result."""
+        QMessageBox.information(self, "Test session", "Testing successful.")
+        self._set_button_group(self._last_button_states)
+
+    def _slot_test_session_error(self, e: Exception) -> None:
+        """Slot for an error during testing of the session."""
+        QMessageBox.critical(
+            self, "Test session", f"Error during testing of session: {e}"
+        )
+        self._set_button_group(self._last_button_states)
 
     def _callback_get_n_jobs(self) -> None:
         """Callback for the 'Get number of jobs' (get_n_jobs) button.
@@ -204,19 +222,18 @@ class MainWindow(QWidget):
         if not self._check_settings_dict(settings_dict):
             return
 
-        self._lock_buttons()
+        self._set_button_group(self.BUTTON_GROUPS.WHILE_ACTION)
         self.worker = Worker(self.scraper.determine_n_jobs, **settings_dict)
         self.worker.result.connect(self._slot_get_n_jobs)
+        self.worker.error.connect(self._slot_worker_error)
         self.worker.start()
-        self._unlock_buttons(self.BUTTON_GROUPS.WHILE_ACTION)
 
     def _slot_get_n_jobs(self, n_jobs: int) -> None:
         """Slot for the get number of jobs result."""
         QMessageBox.information(
             self, "Number of jobs", f"Number of jobs: {n_jobs}"
         )
-        self._unlock_buttons(self._last_button_states)
-        self._lock_buttons(self.BUTTON_GROUPS.WHILE_ACTION)
+        self._set_button_group(self._last_button_states)
 
     def _callback_scrape_jobs(self) -> None:
         """Callback for the 'Fetch jobs' (scrape_jobs) button.
@@ -232,13 +249,13 @@ class MainWindow(QWidget):
         if not self._check_settings_dict(settings_dict):
             return
 
-        self._lock_buttons()
+        self._set_button_group(self.BUTTON_GROUPS.WHILE_ACTION)
         self.worker = Worker(
             self.scraper.scrape_jobs, **settings_dict
         )
         self.worker.result.connect(self._slot_scrape_jobs_result)
+        self.worker.error.connect(self._slot_worker_error)
         self.worker.start()
-        self._unlock_buttons(self.BUTTON_GROUPS.WHILE_ACTION)
 
     def _slot_scrape_jobs_result(self, res: Tuple) -> None:
         """Slot for the scraping jobs result."""
@@ -258,8 +275,7 @@ class MainWindow(QWidget):
             QMessageBox.information(
                 self, "Fetch jobs", "No jobs available with current settings"
             )
-        self._lock_buttons(self.BUTTON_GROUPS.WHILE_ACTION)
-        self._unlock_buttons(self._last_button_states)
+        self._set_button_group(self._last_button_states)
 
     def _callback_filter_job_titles(self) -> None:
         """Callback for the 'Filter job titles' (filter_job_titles) button.
@@ -278,11 +294,9 @@ class MainWindow(QWidget):
             )
             return
 
-        self._lock_buttons()
         current_indices = self.job_table.get_current_dataframe_indices()
         df_res = filter_job_titles(self.df, *filter_lists, current_indices)
         self.job_table.display_jobs(df_res)
-        self._unlock_buttons(self._last_button_states)
 
     def _callback_get_job_descriptions(self) -> None:
         """Callback for the 'Fetch job descriptions' (get_job_descriptions)
@@ -290,15 +304,15 @@ class MainWindow(QWidget):
 
         Shows an information message box upon completion.
         """
-        self._lock_buttons()
+        self._set_button_group(self.BUTTON_GROUPS.WHILE_ACTION)
         current_indices = self.job_table.get_current_dataframe_indices()
         self._l.debug(f"Get job descriptions: {current_indices}")
         self.worker = Worker(
             self.scraper.get_job_descriptions, self.df, current_indices
         )
         self.worker.result.connect(self._slot_get_job_descriptions_result)
+        self.worker.error.connect(self._slot_worker_error)
         self.worker.start()
-        self._unlock_buttons(self.BUTTON_GROUPS.WHILE_ACTION)
 
     def _slot_get_job_descriptions_result(self, res: DataFrame) -> None:
         """Slot for the scraping jobs result."""
@@ -309,8 +323,7 @@ class MainWindow(QWidget):
             "Fetching of job descriptions is completed",
         )
         self._last_button_states = self.BUTTON_GROUPS.AFTER_JOB_DESCR
-        self._lock_buttons(self.BUTTON_GROUPS.WHILE_ACTION)
-        self._unlock_buttons(self._last_button_states)
+        self._set_button_group(self._last_button_states)
 
     def _callback_filter_job_descriptions(self) -> None:
         """Callback for the 'Filter job descriptions' (filter_job_descriptions)
@@ -340,16 +353,27 @@ class MainWindow(QWidget):
         Only saves the data of the jobs that are currently shown in the table
         view.
         """
+        self._set_button_group(self.BUTTON_GROUPS.WHILE_SAVING)
         current_indices = self.job_table.get_current_dataframe_indices()
         self._l.info(f"Saving results to: {self.save_folder}")
-        save_job_dataframe_to_html_file(
+        # The selection with loc is a copy, so the worker does not share its
+        # data with the dataframe of the GUI thread
+        self.worker = Worker(
+            save_job_dataframe_to_html_file,
             self.df.loc[current_indices, :],
             self.metadata,
             folder=self.save_folder,
             use_marked_descriptions=self.mark_descr_keywords_checkbox.isChecked(),
         )
+        self.worker.result.connect(self._slot_save_results_result)
+        self.worker.error.connect(self._slot_worker_error)
+        self.worker.start()
+
+    def _slot_save_results_result(self, _) -> None:
+        """Slot for the save results result."""
         self._results_saved = True
         QMessageBox.information(self, "Saving", "Saving is completed")
+        self._set_button_group(self._last_button_states)
 
     def _callback_reset_table_view(self) -> None:
         """Callback for the 'Reset filters' (reset_table_view) button.
@@ -369,11 +393,13 @@ class MainWindow(QWidget):
         if self.worker is None or not self.worker.isRunning():
             return
 
-        mb = question_messagebox(
-            self,
-            "Stop action",
-            "Are you sure you want to stop the current action?",
-        )
+        if self._stop_worker_messagebox is None:
+            self._stop_worker_messagebox = question_messagebox(
+                self,
+                "Stop action",
+                "Are you sure you want to stop the current action?",
+            )
+        mb = self._stop_worker_messagebox
         self.worker.finished.connect(mb.close)
         res = mb.exec_()
         if res != QMessageBox.Yes:
@@ -385,38 +411,26 @@ class MainWindow(QWidget):
         # solution which directly stops the thread.
         # See: https://doc.qt.io/qtforpython-5/PySide2/QtCore/QThread.html
         self.worker.terminate()
-        self._lock_buttons(self.BUTTON_GROUPS.WHILE_ACTION)
-        self._unlock_buttons(self._last_button_states)
+        self._set_button_group(self._last_button_states)
 
-    def _change_button_states(self, button_states: Dict[str, bool]) -> None:
-        """Change button states.
+    def _slot_worker_error(self, e: Exception) -> None:
+        """Slot for an error raised in the worker thread.
 
-        button_states : Dict[str, bool]
-            Dictionary of button states with button names as keys and
-            states as values.
+        Shows a critical message box and resets the buttons to their state
+        before the worker was started.
         """
-        for name, state in button_states.items():
-            self.buttons[name].setEnabled(state)
+        QMessageBox.critical(self, "Error", f"Error during action: {e}")
+        self._set_button_group(self._last_button_states)
 
-    def _lock_buttons(self, buttons: Optional[BUTTON_GROUPS] = None) -> None:
-        """Lock buttons.
+    def _set_button_group(self, buttons: BUTTON_GROUPS) -> None:
+        """Enable the buttons in a button group and disable all other buttons.
 
-        buttons : Optional[BUTTON_GROUPS]
-            Button group enum. If None, all buttons will be locked.
+        buttons : BUTTON_GROUPS
+            Button group enum.
         """
-        buttons = buttons.value if buttons is not None else self.buttons.keys()
-        button_states = dict(zip(buttons, [False] * len(buttons)))
-        self._change_button_states(button_states)
-
-    def _unlock_buttons(self, buttons: Optional[BUTTON_GROUPS] = None) -> None:
-        """Unlock buttons.
-
-        buttons : Optional[BUTTON_GROUPS]
-            Button group enum. If None, all buttons will be unlocked.
-        """
-        buttons = buttons.value if buttons is not None else self.buttons.keys()
-        button_states = dict(zip(buttons, [True] * len(buttons)))
-        self._change_button_states(button_states)
+        enabled = self._BUTTON_GROUP_SETS[buttons]
+        for name, button in self.buttons.items():
+            button.setEnabled(name in enabled)
 
     def _get_settings_dict(self) -> Dict[str, Any]:
         """Create a dictionary of all specified settings that are needed for
@@ -526,6 +540,7 @@ class Worker(QThread):
     started = pyqtSignal()
     finished = pyqtSignal()
     result = pyqtSignal(object)
+    error = pyqtSignal(object)
 
     def __init__(self, function, *func_args, **func_kwargs):
         """
@@ -545,18 +560,34 @@ class Worker(QThread):
         self.func_args = func_args
         self.func_kwargs = func_kwargs
 
+        self._l = logger.getChild(self.__class__.__name__)
+
         self.finished.connect(self.deleteLater)
 
     def run(self) -> None:
         """Run thread.
 
         Emits signals when the thread is started and finished, and for the
-        result.
+        result. If the callback raises an exception, the error signal is
+        emitted with the exception instead of the result signal.
+
+        The callback and its arguments are released after the call, so that
+        the worker does not keep (large) dataframes alive until it is deleted.
         """
         self.started.emit()
-        res = self.function(*self.func_args, **self.func_kwargs)
-        self.result.emit(res)
-        self.finished.emit()
+        try:
+            res = self.function(*self.func_args, **self.func_kwargs)
+        except Exception as e:
+            self._l.error(f"Error in worker: {repr(e)}")
+            self.error.emit(e)
+        else:
+            self.result.emit(res)
+            del res
+        finally:
+            self.function = None
+            self.func_args = ()
+            self.func_kwargs = {}
+            self.finished.emit()
 
 
 class PandasModel(QAbstractTableModel):
@@ -573,65 +604,158 @@ class PandasModel(QAbstractTableModel):
         C.KEY_HAS_JOB_DESCRIPTION: "Description",
     }
 
+    # Icons for boolean values, shared by all instances. Created on first use,
+    # because a QIcon can only be created after the QApplication.
+    _ICONS: Optional[Dict[bool, QIcon]] = None
+
+    FETCH_BATCH_SIZE = 200  # number of rows that are shown at once
+
     def __init__(self, data, parent=None):
         super().__init__(parent)
         self._data: DataFrame = data
+        # NumPy arrays with the values to show per column: the display strings
+        # for normal columns and the booleans for boolean columns. These are
+        # much faster to index than the dataframe itself, and must be updated
+        # whenever `_data` changes.
+        self._values: List[np.ndarray] = []
+        # Positions of the columns with a boolean dtype
+        self._bool_columns = frozenset()
+        # Names to show in the horizontal header per column
+        self._headers: List[str] = []
+        # Number of rows that are shown, more rows are loaded while scrolling
+        self._n_rows_loaded = 0
         self._l = logger.getChild(self.__class__.__name__)
 
-        self._icons = {
-            True: QIcon(f"{PATH_ICONS}/tick.png"),
-            False: QIcon(f"{PATH_ICONS}/cross.png"),
-        }
+        self.set_dataframe(data)
 
     @property
     def df(self):
         return self._data
 
     def rowCount(self, parent=None):
-        return self._data.shape[0]
+        return self._n_rows_loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._n_rows_loaded < self._data.shape[0]
+
+    def fetchMore(self, parent=QModelIndex()):
+        n_rows = min(
+            self.FETCH_BATCH_SIZE, self._data.shape[0] - self._n_rows_loaded
+        )
+        if n_rows <= 0:
+            return
+
+        self.beginInsertRows(
+            QModelIndex(), self._n_rows_loaded, self._n_rows_loaded + n_rows - 1
+        )
+        self._n_rows_loaded += n_rows
+        self.endInsertRows()
 
     def columnCount(self, parent=None):
         return self._data.shape[1]
 
     def data(self, index, role):
+        # Qt queries many roles per cell, only two of them are used here
+        if role not in (Qt.DisplayRole, Qt.DecorationRole):
+            return None
         if not index.isValid():
             return None
 
-        value = self._data.iloc[index.row(), index.column()]
+        column = index.column()
+        value = self._values[column][index.row()]
+        # Boolean columns are shown as icons instead of text
         if role == Qt.DisplayRole:
-            # value can be a numpy.bool_, which makes `isinstance(value, bool)`
-            # not usable
-            if value not in (True, False):
-                return str(value)
-        elif role == Qt.DecorationRole:
-            return self._icons.get(value, None)
+            if column not in self._bool_columns:
+                return value
+        elif column in self._bool_columns:
+            return self._get_icons().get(value, None)
 
     def headerData(self, section, orientation, role):
         if orientation == Qt.Horizontal and role == Qt.DisplayRole:
-            key = self._data.columns[section]
-            return self.DATAFRAME_KEY_TO_COLUMN_NAME.get(key, C.UNKNOWN)
+            return self._headers[section]
         else:
             return super().headerData(section, orientation, role)
 
     def removeRows(self, row, count, parent=QModelIndex()):
         self._l.debug(f"Deleting rows from '{row}' to '{row + count - 1}'.")
         self.beginRemoveRows(parent, row, row + count - 1)
-        for _ in range(count):
-            self._data.drop(self._data.index[row], inplace=True)
+        # Rows are removed by position, as the index labels are not
+        # necessarily unique
+        positions = np.r_[0:row, row + count:self._data.shape[0]]
+        self._data = self._data.take(positions)
+        self._values = [values[positions] for values in self._values]
+        self._n_rows_loaded -= count
         self.endRemoveRows()
-        self.layoutChanged.emit()
         self._l.debug(f"Dataframe length after deleting: {self._data.shape[0]}")
         return True
 
     def sort(self, column, order):
-        self._data.sort_values(
-            self._data.columns[column],
-            axis="rows",
-            ascending=order == Qt.AscendingOrder,
-            inplace=True,
+        self.layoutAboutToBeChanged.emit()
+        # Only the sorted column is sorted, after which the whole dataframe and
+        # the cached values are reordered with the resulting row positions
+        positions = (
+            self._data.iloc[:, column]
+            .reset_index(drop=True)
+            .sort_values(ascending=order == Qt.AscendingOrder, kind="stable")
+            .index.to_numpy()
         )
+        self._data = self._data.take(positions)
+        self._values = [values[positions] for values in self._values]
         self.layoutChanged.emit()
 
+    @classmethod
+    def _get_icons(cls) -> Dict[bool, QIcon]:
+        """Get the icons for boolean values, creates them on the first call.
+
+        Returns
+        -------
+        Dict[bool, QIcon]
+        """
+        if cls._ICONS is None:
+            cls._ICONS = {
+                True: QIcon(f"{PATH_ICONS}/tick.png"),
+                False: QIcon(f"{PATH_ICONS}/cross.png"),
+            }
+        return cls._ICONS
+
+    def set_dataframe(self, data: DataFrame) -> None:
+        """Replace the dataframe of the model.
+
+        Resets the model instead of creating a new one, so that views keep
+        their header and selection models.
+
+        Parameters
+        ----------
+        data : DataFrame
+        """
+        self.beginResetModel()
+        self._data = data
+        self._n_rows_loaded = min(self.FETCH_BATCH_SIZE, data.shape[0])
+        self._bool_columns = frozenset(
+            i for i, dtype in enumerate(data.dtypes) if is_bool_dtype(dtype)
+        )
+        self._headers = [
+            self.DATAFRAME_KEY_TO_COLUMN_NAME.get(key, C.UNKNOWN)
+            for key in data.columns
+        ]
+        self._update_values()
+        self.endResetModel()
+
+    def _update_values(self) -> None:
+        """Update the NumPy arrays with the values to show per column.
+
+        The values of normal columns are converted to strings once here, so
+        that data() does not have to convert them on every repaint.
+        """
+        self._values = []
+        for i in range(self._data.shape[1]):
+            values = self._data.iloc[:, i].to_numpy()
+            if i not in self._bool_columns:
+                values = np.array([str(v) for v in values], dtype=object)
+            self._values.append(values)
+
 
 class JobTableViewer(QTableView):
     """Table view widget to display the jobs DataFrame."""
@@ -648,13 +772,14 @@ class JobTableViewer(QTableView):
         super().__init__(*args, **kwargs)
 
         self._l = logger.getChild(self.__class__.__name__)
+        self._model = PandasModel(DataFrame(columns=self.DF_COLUMNS_TO_SHOW))
 
         self._init_ui()
 
     def _init_ui(self) -> None:
         """Initialize the user interface of the widget."""
+        self.setModel(self._model)
         self.setShowGrid(False)
-        self.setSizeAdjustPolicy(QHeaderView.AdjustToContents)
         self.setSizePolicy(SIZE_MIN_EXPANDING, SIZE_MIN_EXPANDING)
         self.setSelectionBehavior(QAbstractItemView.SelectRows)
         # NOTE: ContiguousSelection is needed as PandasModel.removeRows() does
@@ -662,12 +787,18 @@ class JobTableViewer(QTableView):
         self.setSelectionMode(QAbstractItemView.ContiguousSelection)
         self.setEditTriggers(QAbstractItemView.NoEditTriggers)
         self.setSortingEnabled(True)
+        self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+        self.setHorizontalScrollMode(QAbstractItemView.ScrollPerPixel)
 
+        # NOTE: ResizeToContents is avoided, as it measures all cells on
+        # every change of the model. Rows have a fixed height, and the column
+        # widths are determined once in display_jobs().
         h_header = self.horizontalHeader()
         v_header = self.verticalHeader()
-        h_header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        h_header.setSectionResizeMode(QHeaderView.Interactive)
         h_header.setSortIndicatorShown(True)
-        v_header.setSectionResizeMode(QHeaderView.ResizeToContents)
+        v_header.setSectionResizeMode(QHeaderView.Fixed)
+        v_header.setDefaultSectionSize(QFontMetrics(self.font()).height() + 4)
 
     def display_jobs(self, df: DataFrame) -> None:
         """Display all jobs from the dataframe. Only shows the column specified
@@ -677,8 +808,8 @@ class JobTableViewer(QTableView):
         ----------
         df : DataFrame
         """
-        model = PandasModel(df.loc[:, self.DF_COLUMNS_TO_SHOW])
-        self.setModel(model)
+        self._model.set_dataframe(df.loc[:, self.DF_COLUMNS_TO_SHOW])
+        self.resizeColumnsToContents()
 
     def get_current_dataframe(self) -> DataFrame:
         """Return the current dataframe that is displayed.
@@ -687,7 +818,7 @@ class JobTableViewer(QTableView):
         -------
         DataFrame
         """
-        return self.model().df
+        return self._model.df
 
     def get_current_dataframe_indices(self) -> pd.Index:
         """Return the current dataframe indices that are displayed.
@@ -707,7 +838,7 @@ class JobTableViewer(QTableView):
             rows = self.selectionModel().selectedRows()
             if len(rows) == 0:
                 return
-            self.model().removeRows(rows[0].row(), len(rows), rows[0])
+            self._model.removeRows(rows[0].row(), len(rows))
             self.selectionModel().clearSelection()
         super().keyPressEvent(e)
 
@@ -743,49 +874,57 @@ class FormSettingsLayout(QFormLayout):
 
         self._l = logger.getChild(self.__class__.__name__)
         self._default_values = default_values
-        # Dictionary to convert the label names to parameter names
-        self._labels_to_params = {}
+        # Dictionary with the input fields, with parameter names as keys
+        self._fields: Dict[str, Union[QLineEdit, QSpinBox]] = {}
+        # Last created settings dictionary, reset when a setting changes
+        self._settings_dict: Optional[Dict[str, str]] = None
 
         for param in setting_params:
             default_value = default_values.get(param, None)
             if isinstance(default_value, int):
                 input_field = QSpinBox()
                 input_field.setValue(default_value)
+                input_field.valueChanged.connect(self._slot_setting_changed)
             else:
                 input_field = QLineEdit()
                 if default_value is not None:
                     input_field.setText(str(default_value))
+                input_field.textChanged.connect(self._slot_setting_changed)
 
             input_field.setSizePolicy(SIZE_MIN_EXPANDING, SIZE_FIXED)
 
             label = param.replace("_", " ").capitalize()
-            self._labels_to_params[label] = param
+            self._fields[param] = input_field
             self.addRow(label, input_field)
 
     def get_settings_dict(self) -> Dict[str, str]:
         """Convert the settings in the input fields to a dictionary.
 
+        The dictionary is only created again after one of the settings has
+        changed.
+
         Returns
         -------
         res : Dict[str, str]
+            Copy of the settings dictionary, which can be modified freely.
         """
-        self._l.debug("Creating a settings dictionary")
-        res = {}
-        for row_id in range(self.rowCount()):
-            label = self.itemAt(row_id, LABEL_ROLE).widget().text()
-            field = self.itemAt(row_id, FIELD_ROLE).widget()
+        if self._settings_dict is None:
+            self._l.debug("Creating a settings dictionary")
+            res = {}
+            for param, field in self._fields.items():
+                if isinstance(field, QLineEdit):
+                    res[param] = field.text()
+                elif isinstance(field, QSpinBox):
+                    res[param] = field.value()
+                else:
+                    raise NotImplementedError
+            self._settings_dict = res
 
-            if isinstance(field, QLineEdit):
-                field = field.text()
-            elif isinstance(field, QSpinBox):
-                field = field.value()
-            else:
-                raise NotImplementedError
-
-            param = self._labels_to_params[label]
-            res[param] = field
+        return dict(self._settings_dict)
 
-        return res
+    def _slot_setting_changed(self) -> None:
+        """Slot for changes of the settings in the input fields."""
+        self._settings_dict = None
 
 
 class WorkLocationLayout(QVBoxLayout):
@@ -796,6 +935,8 @@ class WorkLocationLayout(QVBoxLayout):
 
         self.labels = {}
         self.checkboxes = {}
+        # Checked work locations, reset when a checkbox changes state
+        self._work_location_list: Optional[List[WL]] = None
 
         self._init_ui()
 
@@ -806,6 +947,7 @@ class WorkLocationLayout(QVBoxLayout):
             self.checkboxes[wl] = QCheckBox(
                 wl.name.replace("_", " ").capitalize()
             )
+            self.checkboxes[wl].stateChanged.connect(self._slot_state_changed)
             layout_checkbox.addWidget(self.checkboxes[wl])
 
         layout_b = QHBoxLayout()
@@ -819,19 +961,32 @@ class WorkLocationLayout(QVBoxLayout):
     def get_work_location_list(self) -> List[WL]:
         """Get a list of checked work locations.
 
+        The checkboxes are only read again after one of them has changed
+        state.
+
         Returns
         -------
         wl_list : List[WL]
             List of work locations.
         """
-        wl_list = [wl for wl, cb in self.checkboxes.items() if cb.isChecked()]
+        if self._work_location_list is None:
+            self._work_location_list = [
+                wl for wl, cb in self.checkboxes.items() if cb.isChecked()
+            ]
+        wl_list = list(self._work_location_list)
         return wl_list
 
+    def _slot_state_changed(self) -> None:
+        """Slot for state changes of the checkboxes."""
+        self._work_location_list = None
+
 
 class FilterKeywordsLayout(QVBoxLayout):
     """Layout with label and text edit box for specifying filter keywords.
     """
 
+    MAX_N_CHARACTERS = 4096  # maximum length of the text in the text box
+
     def __init__(
         self,
         name: str,
@@ -853,6 +1008,10 @@ class FilterKeywordsLayout(QVBoxLayout):
         self.name = name
         self.default_keywords = default_keywords
 
+        # Parsed keywords, only parsed again after the text has changed
+        self._keyword_list: Optional[List[str]] = None
+        self._text_changed = True
+
         self._init_ui()
         if self.default_keywords is not None:
             self.set_keywords(self.default_keywords)
@@ -862,9 +1021,11 @@ class FilterKeywordsLayout(QVBoxLayout):
         self.text_edit = QPlainTextEdit()
         self.text_edit.setSizePolicy(SIZE_MIN_EXPANDING, SIZE_FIXED)
         self.text_edit.setFixedHeight(60)
+        self.text_edit.setUndoRedoEnabled(False)
         self.text_edit.setToolTip(
             "Specify filter keywords, must be separated by a `,`"
         )
+        self.text_edit.textChanged.connect(self._slot_text_changed)
 
         self.addWidget(QLabel(f"{self.name}:"))
         self.addWidget(self.text_edit)
@@ -889,7 +1050,9 @@ class FilterKeywordsLayout(QVBoxLayout):
         """Create and return a list of filter keywords.
 
         Splits the user input from the text box on the ',' and adds the
-        resulting keywords to a list.
+        resulting keywords to a list. The keywords are lower-cased and
+        duplicates are removed, as all filters are case-insensitive. The list
+        is cached until the text in the text box changes.
 
         Returns
         -------
@@ -897,11 +1060,46 @@ class FilterKeywordsLayout(QVBoxLayout):
             Returns None if no keywords were specified.
 
         """
-        text = self.text_edit.toPlainText()
-        if text == "":
+        if self._text_changed:
+            text = self.text_edit.toPlainText().strip(" \t\n\r,").lower()
+            if text == "":
+                self._keyword_list = None
+            elif "," not in text:
+                self._keyword_list = [text]
+            else:
+                keywords = KEYWORD_SEPARATOR.split(text)
+                self._keyword_list = list(dict.fromkeys(keywords))
+            self._text_changed = False
+
+        if self._keyword_list is None:
             return None
-        filter_list = text.split(",")
-        return [w.strip() for w in filter_list if w != ""]
+        return list(self._keyword_list)
+
+    def _slot_text_changed(self) -> None:
+        """Slot for changes of the text in the text box.
+
+        Truncates the text if it is longer than MAX_N_CHARACTERS.
+        """
+        self._text_changed = True
+
+        text = self.text_edit.toPlainText()
+        truncated_text = text[: self.MAX_N_CHARACTERS]
+        if truncated_text == text:
+            return
+
+        # NOTE: the cursor position is counted in UTF-16 code units, just like
+        # the length of the document, so the clamping below stays consistent
+        position = self.text_edit.textCursor().position()
+        self.text_edit.blockSignals(True)
+        try:
+            self.text_edit.setPlainText(truncated_text)
+        finally:
+            self.text_edit.blockSignals(False)
+
+        cursor = self.text_edit.textCursor()
+        n_positions = self.text_edit.document().characterCount() - 1
+        cursor.setPosition(min(position, n_positions))
+        self.text_edit.setTextCursor(cursor)
 
 
 def question_messagebox(parent: QWidget, title: str, text: str) -> QMessageBox:
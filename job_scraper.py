@@ -6,17 +6,21 @@ Created on Thu Feb 29 14:44:11 2024
 """
 import os
 import re
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from enum import Enum
+from functools import lru_cache
 from pathlib import Path
 from random import uniform
 from time import sleep
 from typing import Any, Dict, Iterable, Optional, Tuple
+from urllib.parse import quote_plus
 
 import pandas
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
 from pandas import DataFrame
-from requests import Session
+from requests import Response, Session
 from requests.exceptions import RequestException
 
 import constants as C
@@ -65,8 +69,9 @@ class LinkedinSession:
     }
 
     MAX_TRIES = 20
-    MAX_TIMEOUT_ON_429 = 5  # maximum timeout in sec for a 429 status code
+    MAX_TIMEOUT_ON_429 = 30  # maximum timeout in sec for a 429 status code
     MIN_TIMEOUT_ON_429 = 1  # minimum timeout in sec for a 429 status code
+    MAX_TOTAL_TIMEOUT_ON_429 = 60  # maximum total timeout in sec per url
 
     def __init__(self, test_session=False):
         self.session = None
@@ -100,7 +105,11 @@ class LinkedinSession:
     #  several times depending on the raised exceptions (and with exponential
     #  backoff for example)
     def get_html(
-        self, url: str, headers: Optional[Dict[str, str]] = None, **kwargs
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        parse_only: Optional[SoupStrainer] = None,
+        **kwargs,
     ) -> BeautifulSoup:
         """Get the HTML contents of page.
 
@@ -109,6 +118,10 @@ class LinkedinSession:
         url : str
         headers : Optional[Dict[str, str]]
             Dictionary with headers to pass during getting the page contents.
+        parse_only : Optional[SoupStrainer]
+            If passed, only the elements matching the strainer are parsed,
+            which is much faster for large pages of which only a small part
+            is needed.
 
         Returns
         -------
@@ -130,6 +143,8 @@ class LinkedinSession:
             headers = self.HEADERS
 
         res = None
+        n_429 = 0  # number of 429 status codes received for this url
+        timeout_429 = 0  # total time waited on 429 status codes for this url
         for i in range(self.MAX_TRIES):
             self._l.conn(f"Tries remaining: {self.MAX_TRIES - i}")
 
@@ -137,6 +152,7 @@ class LinkedinSession:
                 res = self.session.get(url, headers=headers, **kwargs)
             except (RequestException, SystemError) as e:
                 self._l.conn(f"Requests error: {repr(e)}. Will try again.")
+                n_429, timeout_429 = 0, 0
                 continue
 
             if (sc := res.status_code) == 200:
@@ -144,12 +160,21 @@ class LinkedinSession:
                 break
             elif sc == 429:
                 self._l.conn(f"Too many requests (status code 429).")
-                sleep(uniform(self.MIN_TIMEOUT_ON_429, self.MAX_TIMEOUT_ON_429))
+                if i == self.MAX_TRIES - 1:
+                    break
+                timeout = self._get_timeout_on_429(res, n_429)
+                if timeout_429 + timeout > self.MAX_TOTAL_TIMEOUT_ON_429:
+                    self._l.conn("Maximum total timeout for 429 reached.")
+                    break
+                sleep(timeout)
+                timeout_429 += timeout
+                n_429 += 1
             elif sc == 400:
                 self._l.conn("Bad request (status code 400)")
                 break
             else:
                 self._l.conn(f"Unexpected status code: {sc}. Will try again")
+                n_429, timeout_429 = 0, 0
 
         if res is None:
             self._l.error("Error when using requests.get().")
@@ -165,7 +190,51 @@ class LinkedinSession:
             self._l.error(f"Bad status code for url: {url}")
             raise BadStatusCode(sc)
 
-        return BeautifulSoup(res.content, features="lxml")
+        return BeautifulSoup(
+            res.content, features="lxml", parse_only=parse_only
+        )
+
+    def _get_timeout_on_429(self, res: Response, n_429: int) -> float:
+        """Get the time to wait after receiving a 429 status code.
+
+        Uses the Retry-After header of the response if present, either as a
+        number of seconds or as an HTTP date. Otherwise the timeout increases
+        exponentially with the number of 429 status codes received, with some
+        random jitter so that concurrent requests do not retry at the same
+        time.
+
+        Parameters
+        ----------
+        res : Response
+            Response with the 429 status code.
+        n_429 : int
+            Number of 429 status codes received before this one.
+
+        Returns
+        -------
+        float
+            Timeout in seconds, at most MAX_TIMEOUT_ON_429.
+        """
+        retry_after = res.headers.get("Retry-After", "").strip()
+        if retry_after.isdigit():
+            return min(float(retry_after), self.MAX_TIMEOUT_ON_429)
+
+        if retry_after:
+            try:
+                retry_date = parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                # NOTE: an invalid Retry-After header is ignored, and the
+                # exponential backoff below is used instead
+                self._l.conn(f"Invalid Retry-After header: '{retry_after}'.")
+            else:
+                if retry_date.tzinfo is None:
+                    retry_date = retry_date.replace(tzinfo=timezone.utc)
+                now = datetime.now(timezone.utc)
+                timeout = max((retry_date - now).total_seconds(), 0)
+                return min(timeout, self.MAX_TIMEOUT_ON_429)
+
+        timeout = self.MIN_TIMEOUT_ON_429 * 2**n_429 * uniform(1, 1.5)
+        return min(timeout, self.MAX_TIMEOUT_ON_429)
 
     def close(self) -> None:
         """Close the session."""
@@ -178,6 +247,19 @@ class LinkedinJobScraper:
     N_DAYS = 1
     GEO_ID = "102890719"
     WORK_LOCATION = (WL.HYBRID, WL.REMOTE, WL.ON_SITE)
+    N_CONCURRENT_PAGES = 4  # number of job pages that are fetched at once
+    N_CONCURRENT_DESCRIPTIONS = 4  # number of descriptions fetched at once
+
+    # Only the parts of the pages that are used are parsed. The strainers
+    # match on the raw class attribute, which can contain multiple classes.
+    STRAINER_JOB_PAGE = SoupStrainer("li")
+    STRAINER_N_JOBS = SoupStrainer(
+        "span", class_=re.compile(r"\bresults-context-header__job-count\b")
+    )
+    STRAINER_JOB_DESCRIPTION = SoupStrainer(
+        "div", class_=re.compile(r"\bshow-more-less-html__markup\b")
+    )
+    PATTERN_JOB_LINK = re.compile("linkedin.com/jobs/view")
 
     def __init__(self, session):
         self.session: LinkedinSession = session
@@ -199,7 +281,8 @@ class LinkedinJobScraper:
         """
         if self._n_jobs_per_page is None:
             self._l.debug("Determining the number of jobs per page")
-            html = self._get_job_page(C.URL_TEST_CONNECTION)
+            # The whole page is parsed, as the doctype is needed
+            html = self._get_job_page(C.URL_TEST_CONNECTION, parse_only=None)
             # TODO-2: is there a better way of determining this?
             if str(html).startswith("<!DOCTYPE html>"):
                 self._n_jobs_per_page = 10
@@ -253,24 +336,56 @@ class LinkedinJobScraper:
         )
         page = page_start
         job_list = []
-        while True:
-            self._l.info(f"Fetching jobs from page {page}")
-            url = C.URL_JOB_PAGE.format(
-                start=page * self.n_jobs_per_page, **metadata
-            )
-            html = self._get_job_page(url)
-            if html is None:
-                break
-
-            jobs = html.find_all("li")
-            if len(jobs) == 0:
-                break
-
-            for job in jobs:
-                job_dict = self._extract_info_from_single_job_on_job_page(job)
-                job_list.append(job_dict)
-
-            page += 1
+        n_jobs_per_page = self.n_jobs_per_page
+        # NOTE: n_jobs_per_page is a guess, so pages are compared with the
+        # largest page that is actually received instead
+        max_jobs_per_page = 0
+        with ThreadPoolExecutor(self.N_CONCURRENT_PAGES) as executor:
+            last_page_reached = False
+            while not last_page_reached:
+                pages = range(page, page + self.N_CONCURRENT_PAGES)
+                self._l.info(f"Fetching jobs from pages {pages[0]}-{pages[-1]}")
+                urls = [
+                    build_job_page_url(metadata, p * n_jobs_per_page)
+                    for p in pages
+                ]
+                # Pages are requested concurrently, but processed in order.
+                # Everything after the first missing or empty page is ignored.
+                n_jobs_last_page = 0
+                for html in executor.map(self._get_job_page, urls):
+                    if html is None:
+                        last_page_reached = True
+                        break
+
+                    jobs = html.find_all("li")
+                    if len(jobs) == 0:
+                        last_page_reached = True
+                        break
+
+                    job_list.extend(
+                        self._extract_info_from_single_job_on_job_page(job)
+                        for job in jobs
+                    )
+                    n_jobs_last_page = len(jobs)
+                    max_jobs_per_page = max(max_jobs_per_page, n_jobs_last_page)
+
+                # If the last page of the batch contains fewer jobs than the
+                # largest page so far, it is the last page with jobs, and no
+                # new pages are fetched. A short page followed by a full page
+                # in the same batch is ignored.
+                if (
+                    not last_page_reached
+                    and n_jobs_last_page < max_jobs_per_page
+                ):
+                    self._l.info(
+                        f"Page {pages[-1]} contains {n_jobs_last_page} jobs, "
+                        f"while earlier pages contain up to "
+                        f"{max_jobs_per_page} jobs, assuming it is the last "
+                        f"page with jobs."
+                    )
+                    last_page_reached = True
+
+                page += self.N_CONCURRENT_PAGES
 
         df = DataFrame(job_list)
         # TODO: should this be here?
@@ -278,12 +393,19 @@ class LinkedinJobScraper:
 
         return df, metadata
 
-    def _get_job_page(self, url: str) -> Optional[BeautifulSoup]:
+    def _get_job_page(
+        self,
+        url: str,
+        parse_only: Optional[SoupStrainer] = STRAINER_JOB_PAGE,
+    ) -> Optional[BeautifulSoup]:
         """Get job page with error handling.
 
         Parameters
         ----------
         url : str
+        parse_only : Optional[SoupStrainer]
+            Strainer to pass to get_html(). By default only the job list
+            entries are parsed.
 
         Returns
         -------
@@ -292,7 +414,7 @@ class LinkedinJobScraper:
             during fetching of the page.
         """
         try:
-            html = self.session.get_html(url)
+            html = self.session.get_html(url, parse_only=parse_only)
         except (TimeoutError, BadStatusCode, SystemError) as e:
             self._l.warning(
                 f"Error when fetching job page: {repr(e)}. It is possible "
@@ -364,7 +486,7 @@ class LinkedinJobScraper:
         job_location = html_job.find(
             "span", {"class": "job-search-card__location"}
         )
-        link = html_job.find(href=re.compile("linkedin.com/jobs/view"))
+        link = html_job.find(href=self.PATTERN_JOB_LINK)
         date = html_job.find(
             "time", {"class": "job-search-card__listdate--new"}
         )
@@ -427,8 +549,8 @@ class LinkedinJobScraper:
         metadata = self._format_url_metadata(
             keywords, n_days, location, geo_id, work_location
         )
-        url = C.URL_FOR_N_JOBS.format(**metadata)
-        html = self.session.get_html(url)
+        url = build_n_jobs_url(metadata)
+        html = self.session.get_html(url, parse_only=self.STRAINER_N_JOBS)
 
         html_n_jobs = html.find("span", "results-context-header__job-count")
         if html_n_jobs is None:
@@ -451,9 +573,11 @@ class LinkedinJobScraper:
 
         """
         self._l.info(f"Fetching job description for job with ID: {job_id}")
-        url = C.URL_SINGLE_JOB.format(job_id=job_id)
+        url = build_single_job_url(job_id)
         try:
-            html = self.session.get_html(url)
+            html = self.session.get_html(
+                url, parse_only=self.STRAINER_JOB_DESCRIPTION
+            )
         except (TimeoutError, BadStatusCode):
             return None
 
@@ -467,7 +591,8 @@ class LinkedinJobScraper:
         """Get descriptions for jobs in the dataframe.
 
         Optionally can pass an index filter to select jobs of which to fetch the
-        descriptions.
+        descriptions. Descriptions that are already in the dataframe are not
+        fetched again.
 
         Adds two columns to the dataframe:
             - description_html: job description in HTML format
@@ -490,16 +615,34 @@ class LinkedinJobScraper:
 
         """
 
-        df_temp = df.loc[index_filter, :] if index_filter is not None else df
         if C.KEY_JOB_DESCRIPTION not in df:
             df[C.KEY_JOB_DESCRIPTION] = None
-        for row_id, row in df_temp.iterrows():
-            descr = self.get_html_job_description(row[C.KEY_JOB_ID])
-            df.loc[row_id, C.KEY_JOB_DESCRIPTION] = (
-                descr.prettify() if descr is not None else C.UNKNOWN
-            )
+        df_temp = df.loc[index_filter, :] if index_filter is not None else df
+        # Descriptions that were fetched before are not fetched again, only
+        # the missing and failed ones
+        descriptions_old = df_temp[C.KEY_JOB_DESCRIPTION]
+        job_ids = df_temp.loc[
+            descriptions_old.isnull() | (descriptions_old == C.UNKNOWN),
+            C.KEY_JOB_ID,
+        ]
+        # The descriptions are fetched concurrently over the pooled
+        # connections of the session. They are requested in batches, so that
+        # at most one batch is still being fetched when the thread calling
+        # this method is terminated.
+        n_batch = self.N_CONCURRENT_DESCRIPTIONS
+        descriptions = []
+        with ThreadPoolExecutor(n_batch) as executor:
+            for start in range(0, len(job_ids), n_batch):
+                descriptions.extend(
+                    str(descr) if descr is not None else C.UNKNOWN
+                    for descr in executor.map(
+                        self.get_html_job_description,
+                        job_ids.iloc[start : start + n_batch],
+                    )
+                )
+        df.loc[job_ids.index, C.KEY_JOB_DESCRIPTION] = descriptions
 
-        df[C.KEY_HAS_JOB_DESCRIPTION] = ~df[C.KEY_JOB_DESCRIPTION].isnull()
+        df[C.KEY_HAS_JOB_DESCRIPTION] = df[C.KEY_JOB_DESCRIPTION].notnull()
 
         return df.loc[df[C.KEY_HAS_JOB_DESCRIPTION], :]
 
@@ -598,18 +741,25 @@ def filter_job_titles(
     )
 
     index_filter = index_filter if index_filter is not None else df.index
-
-    # Default values whether to always keep, keep, or discard titles
-    i = {"always_keep": False, "keep": True, "discard": False}
+    titles = df.loc[index_filter, C.KEY_TITLE]
+
+    # Default values whether to always keep, keep, or discard titles, as
+    # boolean series so that the masks are combined with NumPy
+    i = {
+        "always_keep": pandas.Series(False, index=titles.index),
+        "keep": pandas.Series(True, index=titles.index),
+        "discard": pandas.Series(False, index=titles.index),
+    }
     for type_, keywords in zip(
         ("always_keep", "keep", "discard"),
         (keywords_always_keep, keywords_keep, keywords_discard),
     ):
         if keywords is not None:
-            i[type_] = df.loc[index_filter, C.KEY_TITLE].apply(
-                contains_keywords, args=(keywords,)
-            )
+            i[type_] = series_contains_keywords(titles, keywords)
 
+    # Jobs outside of the index filter are not kept, and the column stays
+    # boolean instead of being filled with NaN for those jobs
+    df[C.KEY_KEEP_JOB_AFTER_TITLE_FILTER] = False
     # fmt: off
     df.loc[index_filter, C.KEY_KEEP_JOB_AFTER_TITLE_FILTER] = (
         i["always_keep"] | (i["keep"] & ~i["discard"])
@@ -664,20 +814,28 @@ def filter_job_descriptions(
 
     df[C.KEY_DESCR_CONTAINS_KEYWORD] = None
     df[C.KEY_JOB_DESCRIPTION_MARKED] = None
-    for row_id, row in df_temp.iterrows():
-        if (descr := row[C.KEY_JOB_DESCRIPTION]) is None:
-            continue
-        elif descr is not C.UNKNOWN:
-            if mark_keywords:
-                contains_keyword, descr = mark_keywords_html(descr, keywords)
-                df.loc[row_id, C.KEY_JOB_DESCRIPTION_MARKED] = descr
-            else:
-                contains_keyword = contains_keywords(descr.lower(), keywords)
 
-        else:
-            contains_keyword = C.UNKNOWN
-
-        df.loc[row_id, C.KEY_DESCR_CONTAINS_KEYWORD] = contains_keyword
+    descriptions = df_temp[C.KEY_JOB_DESCRIPTION]
+    descriptions = descriptions[descriptions.notnull()]
+    is_unknown = descriptions == C.UNKNOWN
+    descriptions_known = descriptions[~is_unknown]
+    # The columns are set once for all jobs instead of per row
+    if mark_keywords:
+        res = [mark_keywords_html(d, keywords) for d in descriptions_known]
+        contains_keyword = [contains for contains, _ in res]
+        df.loc[descriptions_known.index, C.KEY_JOB_DESCRIPTION_MARKED] = [
+            descr for _, descr in res
+        ]
+    else:
+        contains_keyword = series_contains_keywords(
+            descriptions_known, keywords
+        )
+    df.loc[descriptions_known.index, C.KEY_DESCR_CONTAINS_KEYWORD] = (
+        contains_keyword
+    )
+    df.loc[descriptions[is_unknown].index, C.KEY_DESCR_CONTAINS_KEYWORD] = (
+        C.UNKNOWN
+    )
 
     return df[df[C.KEY_DESCR_CONTAINS_KEYWORD].isin([True, C.UNKNOWN])]
 
@@ -699,6 +857,94 @@ def convert_days_to_sec(n_days: int) -> int:
     return n_days * 3600 * 24
 
 
+@lru_cache(maxsize=256)
+def _quote(value: Any) -> str:
+    """URL encode a search parameter value.
+
+    The search parameters stay the same for all pages of one search, so the
+    encoded values are cached.
+
+    Parameters
+    ----------
+    value : Any
+
+    Returns
+    -------
+    str
+
+    """
+    return quote_plus(str(value), safe=",")
+
+
+def build_n_jobs_url(metadata: Dict[str, Any]) -> str:
+    """Build the URL of the search page which shows the total number of jobs.
+
+    Parameters
+    ----------
+    metadata : Dict[str, Any]
+        Search parameters, see LinkedinJobScraper._format_url_metadata().
+
+    Returns
+    -------
+    str
+
+    """
+    f = C.URL_FOR_N_JOBS_FRAGMENTS
+    # fmt: off
+    return "".join((
+        f[0], _quote(metadata[C.URL_PARAM_KEYWORDS]),
+        f[1], str(metadata[C.URL_PARAM_N_SECONDS]),
+        f[2], _quote(metadata[C.URL_PARAM_LOCATION]),
+        f[3], _quote(metadata[C.URL_PARAM_GEO_ID]),
+        f[4], _quote(metadata[C.URL_PARAM_WORK_LOCATION]),
+    ))
+    # fmt: on
+
+
+def build_job_page_url(metadata: Dict[str, Any], start: int) -> str:
+    """Build the URL of a job page.
+
+    Parameters
+    ----------
+    metadata : Dict[str, Any]
+        Search parameters, see LinkedinJobScraper._format_url_metadata().
+    start : int
+        Index of the first job on the page.
+
+    Returns
+    -------
+    str
+
+    """
+    f = C.URL_JOB_PAGE_FRAGMENTS
+    # fmt: off
+    return "".join((
+        f[0], _quote(metadata[C.URL_PARAM_KEYWORDS]),
+        f[1], str(metadata[C.URL_PARAM_N_SECONDS]),
+        f[2], _quote(metadata[C.URL_PARAM_LOCATION]),
+        f[3], _quote(metadata[C.URL_PARAM_GEO_ID]),
+        f[4], _quote(metadata[C.URL_PARAM_WORK_LOCATION]),
+        f[5], str(start),
+    ))
+    # fmt: on
+
+
+def build_single_job_url(job_id: str) -> str:
+    """Build the URL of the page of a single job.
+
+    Parameters
+    ----------
+    job_id : str
+        Job identifier.
+
+    Returns
+    -------
+    str
+
+    """
+    return C.URL_SINGLE_JOB_PREFIX + str(job_id)
+
+
 def contains_keywords(string: str, keywords: Iterable[str]) -> bool:
     """Checks if a string contains any of the passed keywords
     (case-insensitive).
@@ -715,11 +961,66 @@ def contains_keywords(string: str, keywords: Iterable[str]) -> bool:
         True if any of the keywords are in `string`, False if not.
 
     """
-    string = string.lower()
-    for keyword in keywords:
-        if keyword.lower() in string:
-            return True
-    return False
+    keywords = tuple(keywords)
+    if len(keywords) == 0:
+        return False
+
+    # The cached case-insensitive pattern avoids lowercasing the string and
+    # every keyword on each call
+    return _compile_keywords_pattern(keywords).search(string) is not None
+
+
+def series_contains_keywords(
+    series: pandas.Series, keywords: Iterable[str]
+) -> pandas.Series:
+    """Checks for every string in a series if it contains any of the passed
+    keywords (case-insensitive).
+
+    Vectorized version of contains_keywords(), which checks all strings with
+    the same cached regular expression.
+
+    Parameters
+    ----------
+    series : pandas.Series
+        Series of strings.
+    keywords : Iterable[str]
+        Iterable of keywords to search for.
+
+    Returns
+    -------
+    pandas.Series
+        Boolean series, True where the string contains any of the keywords.
+
+    """
+    keywords = tuple(keywords)
+    if len(keywords) == 0:
+        return pandas.Series(False, index=series.index)
+
+    return series.str.contains(_compile_keywords_pattern(keywords), na=False)
+
+
+@lru_cache(maxsize=32)
+def _compile_keywords_pattern(keywords: Tuple[str, ...]) -> re.Pattern:
+    """Compile a case-insensitive regular expression which matches any of the
+    keywords.
+
+    Longer keywords are placed first in the alternation, so that a keyword
+    which contains another keyword is matched as a whole.
+
+    Parameters
+    ----------
+    keywords : Tuple[str, ...]
+        Tuple of keywords, which are matched literally.
+
+    Returns
+    -------
+    re.Pattern
+
+    """
+    keywords = sorted(keywords, key=len, reverse=True)
+    return re.compile(
+        "|".join(re.escape(keyword) for keyword in keywords), re.IGNORECASE
+    )
 
 
 def mark_keywords_html(
@@ -742,20 +1043,47 @@ def mark_keywords_html(
     string_marked : str
         Same as `string` but with all the found keywords marked using HTML.
     """
-    string_marked = string
-    contains_keyword = False
-    for keyword in keywords:
-        string_marked, count = re.subn(
-            pattern=keyword,
-            repl=C.HTML_KEYWORD_MARK.format(keyword=keyword.capitalize()),
-            string=string_marked,
-            flags=re.RegexFlag.IGNORECASE,
-        )
-        contains_keyword = contains_keyword | count > 0
+    keywords = tuple(keywords)
+    if len(keywords) == 0:
+        return False, string
+
+    string_marked, count = _compile_keywords_pattern(keywords).subn(
+        lambda match: C.HTML_KEYWORD_MARK.format(
+            keyword=match.group(0).capitalize()
+        ),
+        string,
+    )
+    contains_keyword = count > 0
 
     return contains_keyword, string_marked
 
 
+def render_job_title_html(
+    link: str, title: str, company: str, location: str
+) -> str:
+    """Render the HTML title of a job, which links to the job page.
+
+    Parameters
+    ----------
+    link : str
+    title : str
+    company : str
+    location : str
+
+    Returns
+    -------
+    str
+
+    """
+    f = C.HTML_JOB_TITLE_FRAGMENTS
+    # fmt: off
+    return "".join((
+        f[0], str(link), f[1], str(title), f[2], str(company), f[3],
+        str(location), f[4],
+    ))
+    # fmt: on
+
+
 def save_job_dataframe_to_html_file(
     df: DataFrame,
     metadata: Dict[str, Any],
@@ -799,25 +1127,34 @@ def save_job_dataframe_to_html_file(
 
     Path(folder).mkdir(parents=True, exist_ok=True)
 
+    # The columns are read once as lists, which is much faster than
+    # iterating over the rows of the dataframe
+    n_jobs = df.shape[0]
+    columns = [
+        df[key].tolist() if key in df else [C.UNKNOWN] * n_jobs
+        for key in (
+            C.KEY_LINK,
+            C.KEY_TITLE,
+            C.KEY_COMPANY,
+            C.KEY_LOCATION,
+            C.KEY_JOB_DESCRIPTION,
+        )
+    ]
+    if use_marked_descriptions and C.KEY_JOB_DESCRIPTION_MARKED in df:
+        descriptions_marked = df[C.KEY_JOB_DESCRIPTION_MARKED].tolist()
+    else:
+        descriptions_marked = [None] * n_jobs
+
+    # The file is written at once, instead of in small parts per job
+    parts = [C.HTML_START, C.HTML_MARK_SETTINGS, C.HTML_BODY_START]
+    for link, title, company, location, descr, descr_marked in zip(
+        *columns, descriptions_marked
+    ):
+        parts.append(render_job_title_html(link, title, company, location))
+        parts.append(str(descr_marked if descr_marked is not None else descr))
+        parts.append(C.HTML_JOB_SEPARATOR)
+    parts.append(C.HTML_BODY_END)
+    parts.append(C.HTML_END)
+
     with open(f"{folder}/{filename}", "w", encoding="utf-8") as f:
-        f.write(C.HTML_START)
-        f.write(C.HTML_MARK_SETTINGS)
-        f.write(C.HTML_BODY_START)
-        for row_id, row in df.iterrows():
-            f.write(
-                C.HTML_JOB_TITLE.format(
-                    link=row.get(C.KEY_LINK, C.UNKNOWN),
-                    title=row.get(C.KEY_TITLE, C.UNKNOWN),
-                    company=row.get(C.KEY_COMPANY, C.UNKNOWN),
-                    location=row.get(C.KEY_LOCATION, C.UNKNOWN),
-                )
-            )
-            if use_marked_descriptions:
-                descr = row.get(C.KEY_JOB_DESCRIPTION_MARKED, None)
-
-            if not use_marked_descriptions or descr is None:
-                descr = row.get(C.KEY_JOB_DESCRIPTION, C.UNKNOWN)
-            f.write(str(descr))
-            f.write(C.HTML_JOB_SEPARATOR)
-        f.write(C.HTML_BODY_END)
-        f.write(C.HTML_END)
+        f.write("".join(parts))